@@ -1,13 +1,14 @@
 import asyncio
-import datetime
+import contextlib
 import json
 import logging
 import random
 import time
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from typing import Callable, List, MutableMapping, Optional, TYPE_CHECKING, Tuple, Union, cast
 
 import aiohttp
+import apsw
 import discord
 import lavalink
 from lavalink.rest_api import LoadResult
@@ -36,6 +37,34 @@ if TYPE_CHECKING:
 _ = Translator("Audio", __file__)
 log = logging.getLogger("red.cogs.Audio.api.AudioAPIInterface")
 _TOP_100_US = "https://www.youtube.com/playlist?list=PL4fGSI1pDJn5rWitrRWFKdm-ulaFiIyoK"
+_WRITER_FLUSH_INTERVAL = 0.2
+_WRITER_FLUSH_ROWS = 500
+_YOUTUBE_LOOKUP_CONCURRENCY = 6
+_LRU_CACHE_SIZE = 4096
+_NOTIFIER_UPDATE_INTERVAL = 1.5
+_AutoplayContext = namedtuple("_AutoplayContext", "message guild cog")
+_FAILED_LOAD_RESULT = LoadResult({"loadType": "LOAD_FAILED", "playlistInfo": {}, "tracks": []})
+_REQUIRED_RESULT_KEYS = frozenset(("loadType", "playlistInfo"))
+_REQUIRED_TRACK_KEYS = frozenset(("isSeekable", "isStream"))
+_CACHE_LEVEL_TTL = 5.0
+_LAVALINK_CACHE = CacheLevel.set_lavalink()
+_YOUTUBE_CACHE = CacheLevel.set_youtube()
+_SPOTIFY_CACHE = CacheLevel.set_spotify()
+
+
+class _PendingTasks:
+    """Pending write tasks queued for a single context"""
+
+    __slots__ = ("update", "insert", "global_")
+
+    def __init__(self) -> None:
+        self.update: List[Tuple] = []
+        self.insert: List[Tuple] = []
+        self.global_: List[Tuple] = []
+
+    def for_event(self, event: str) -> List[Tuple]:
+        """Return the task list matching an event name"""
+        return getattr(self, "global_" if event == "global" else event)
 
 
 class AudioAPIInterface:
@@ -61,37 +90,111 @@ class AudioAPIInterface:
         self.local_cache_api = LocalCacheWrapper(self.bot, self.config, self.conn, self.cog)
         self.global_cache_api = GlobalCacheWrapper(self.bot, self.config, session, self.cog)
         self._session: aiohttp.ClientSession = session
-        self._tasks: MutableMapping = {}
+        self._tasks: MutableMapping[int, _PendingTasks] = {}
         self._lock: asyncio.Lock = asyncio.Lock()
+        self._read_conn: Optional[APSWConnectionWrapper] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._flush_event: asyncio.Event = asyncio.Event()
+        self._pending_rows: int = 0
+        self._lru_caches: MutableMapping[str, OrderedDict] = {
+            "youtube": OrderedDict(),
+            "spotify": OrderedDict(),
+        }
+        self._inflight_queries: MutableMapping[Tuple, asyncio.Future] = {}
+        self._autoplay_prefetch: MutableMapping[int, asyncio.Task] = {}
+        self._cache_level_memo: Optional[Tuple[float, CacheLevel]] = None
 
     async def initialize(self) -> None:
         """Initialises the Local Cache connection"""
         await self.local_cache_api.lavalink.init()
+        try:
+            self._read_conn = APSWConnectionWrapper(
+                self.conn.filename, flags=apsw.SQLITE_OPEN_READONLY
+            )
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed to open a read-only cache connection")
+        else:
+            self.local_cache_api.attach_read_connection(self._read_conn)
+        self._writer_task = asyncio.create_task(self._writer_loop())
 
     def close(self) -> None:
         """Closes the Local Cache connection"""
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            self._writer_task = None
+        for task in self._autoplay_prefetch.values():
+            task.cancel()
+        self._autoplay_prefetch.clear()
+        if self._read_conn is not None:
+            with contextlib.suppress(Exception):
+                self._read_conn.close()
+            self._read_conn = None
         self.local_cache_api.lavalink.close()
 
+    async def _writer_loop(self) -> None:
+        """Background writer which coalesces queued writes across contexts.
+
+        Flushes whenever enough rows pile up or on a short timer, so bursts
+        of small writes from many guilds share a single batch per table.
+        """
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._flush_event.wait(), timeout=_WRITER_FLUSH_INTERVAL)
+            self._flush_event.clear()
+            if self._tasks:
+                await self.run_all_pending_tasks()
+
+    async def _get_ctx_cache_level(self, ctx: Optional[commands.Context]) -> CacheLevel:
+        """Get the configured cache level, memoized on the context for its lifetime"""
+        if ctx is None or not isinstance(ctx, commands.Context):
+            # Pseudo-contexts (autoplay) don't accept attributes; use the TTL memo.
+            memo = self._cache_level_memo
+            now = time.monotonic()
+            if memo is not None and (now - memo[0]) < _CACHE_LEVEL_TTL:
+                return memo[1]
+            cache_level = CacheLevel(await self.config.cache_level())
+            self._cache_level_memo = (now, cache_level)
+            return cache_level
+        cache_level = getattr(ctx, "_audio_cache_level", None)
+        if cache_level is None:
+            cache_level = CacheLevel(await self.config.cache_level())
+            ctx._audio_cache_level = cache_level
+        return cache_level
+
+    def _lru_cache_get(self, table: str, key: str) -> Optional[Union[str, MutableMapping]]:
+        """Get an entry from the in-process cache, marking it as recently used"""
+        cache = self._lru_caches[table]
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    def _lru_cache_put(self, table: str, key: str, value: Union[str, MutableMapping]) -> None:
+        """Store an entry in the in-process cache, evicting the oldest on overflow"""
+        cache = self._lru_caches[table]
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > _LRU_CACHE_SIZE:
+            cache.popitem(last=False)
+
     async def get_random_track_from_db(self) -> Optional[MutableMapping]:
         """Get a random track from the local database and return it"""
         track: Optional[MutableMapping] = {}
         try:
             query_data = {}
-            date = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=7)
-            date_timestamp = int(date.timestamp())
-            query_data["day"] = date_timestamp
+            time_now = int(time.time())
+            query_data["day"] = time_now - 7 * 86400
             max_age = await self.config.cache_age()
-            maxage = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(
-                days=max_age
-            )
-            maxage_int = int(time.mktime(maxage.timetuple()))
-            query_data["maxage"] = maxage_int
+            query_data["maxage"] = time_now - max_age * 86400
             track = await self.local_cache_api.lavalink.fetch_random(query_data)
             if track is not None:
                 if track.get("loadType") == "V2_COMPACT":
                     track["loadType"] = "V2_COMPAT"
                 results = LoadResult(track)
-                track = random.choice(list(results.tracks))
+                tracks = results.tracks
+                if not isinstance(tracks, (list, tuple)):
+                    tracks = tuple(tracks)
+                track = tracks[random.randrange(len(tracks))]
         except Exception as exc:
             debug_exc_log(log, exc, "Failed to fetch a random track from database")
             track = {}
@@ -102,28 +205,44 @@ class AudioAPIInterface:
         return track
 
     async def route_tasks(
-        self, action_type: str = None, data: Union[List[MutableMapping], MutableMapping] = None,
+        self,
+        action_type: str = None,
+        table: str = None,
+        data: Union[List[MutableMapping], MutableMapping] = None,
     ) -> None:
-        """Separate the tasks and run them in the appropriate functions"""
+        """Run a single batch of tasks against the appropriate table api"""
 
         if not data:
             return
         if action_type == "insert" and isinstance(data, list):
-            for table, d in data:
-                if table == "lavalink":
-                    await self.local_cache_api.lavalink.insert(d)
-                elif table == "youtube":
-                    await self.local_cache_api.youtube.insert(d)
-                elif table == "spotify":
-                    await self.local_cache_api.spotify.insert(d)
-        elif action_type == "update" and isinstance(data, dict):
-            for table, d in data:
+            if table == "lavalink":
+                await self.local_cache_api.lavalink.insert(data)
+            elif table == "youtube":
+                await self.local_cache_api.youtube.insert(data)
+            elif table == "spotify":
+                await self.local_cache_api.spotify.insert(data)
+        elif action_type == "update" and isinstance(data, list):
+            for d in data:
                 if table == "lavalink":
-                    await self.local_cache_api.lavalink.update(data)
+                    await self.local_cache_api.lavalink.update(d)
                 elif table == "youtube":
-                    await self.local_cache_api.youtube.update(data)
+                    await self.local_cache_api.youtube.update(d)
                 elif table == "spotify":
-                    await self.local_cache_api.spotify.update(data)
+                    await self.local_cache_api.spotify.update(d)
+
+    @staticmethod
+    def _merge_tasks(task_groups: List[_PendingTasks],) -> MutableMapping[Tuple[str, str], List]:
+        """Merge queued tasks into a single batch per (action, table) pair"""
+        merged: MutableMapping[Tuple[str, str], List] = {}
+        for task_group in task_groups:
+            for action in ("update", "insert", "global"):
+                for (table, payload) in task_group.for_event(action):
+                    rows = merged.setdefault((action, table), [])
+                    if isinstance(payload, list):
+                        rows.extend(payload)
+                    else:
+                        rows.append(payload)
+        return merged
 
     async def run_tasks(self, ctx: Optional[commands.Context] = None, message_id=None) -> None:
         """Run tasks for a specific context"""
@@ -135,49 +254,57 @@ class AudioAPIInterface:
             return
         lock_author = ctx.author if ctx else None
         async with self._lock:
-            if lock_id in self._tasks:
+            tasks = self._tasks.pop(lock_id, None)
+        if tasks is not None:
+            if IS_DEBUG:
+                log.debug(f"Running database writes for {lock_id} ({lock_author})")
+            try:
+                merged = self._merge_tasks([tasks])
+                await asyncio.gather(
+                    *[
+                        self.route_tasks(action, table, rows)
+                        for (action, table), rows in merged.items()
+                    ],
+                    return_exceptions=True,
+                )
+            except Exception as exc:
+                debug_exc_log(log, exc, f"Failed database writes for {lock_id} ({lock_author})")
+            else:
                 if IS_DEBUG:
-                    log.debug(f"Running database writes for {lock_id} ({lock_author})")
-                try:
-                    tasks = self._tasks[lock_id]
-                    tasks = [self.route_tasks(a, tasks[a]) for a in tasks]
-                    await asyncio.gather(*tasks, return_exceptions=True)
-                    del self._tasks[lock_id]
-                except Exception as exc:
-                    debug_exc_log(
-                        log, exc, f"Failed database writes for {lock_id} ({lock_author})"
-                    )
-                else:
-                    if IS_DEBUG:
-                        log.debug(f"Completed database writes for {lock_id} ({lock_author})")
+                    log.debug(f"Completed database writes for {lock_id} ({lock_author})")
 
     async def run_all_pending_tasks(self) -> None:
         """Run all pending tasks left in the cache, called on cog_unload"""
         async with self._lock:
+            task_groups = list(self._tasks.values())
+            self._tasks = {}
+            self._pending_rows = 0
+        if IS_DEBUG:
+            log.debug("Running pending writes to database")
+        try:
+            merged = self._merge_tasks(task_groups)
+            await asyncio.gather(
+                *[
+                    self.route_tasks(action, table, rows)
+                    for (action, table), rows in merged.items()
+                ],
+                return_exceptions=True,
+            )
+        except Exception as exc:
+            debug_exc_log(log, exc, "Failed database writes")
+        else:
             if IS_DEBUG:
-                log.debug("Running pending writes to database")
-            try:
-                tasks: MutableMapping = {"update": [], "insert": [], "global": []}
-                async for k, task in AsyncIter(self._tasks.items()):
-                    async for t, args in AsyncIter(task.items()):
-                        tasks[t].append(args)
-                self._tasks = {}
-                coro_tasks = [self.route_tasks(a, tasks[a]) for a in tasks]
-
-                await asyncio.gather(*coro_tasks, return_exceptions=True)
-
-            except Exception as exc:
-                debug_exc_log(log, exc, "Failed database writes")
-            else:
-                if IS_DEBUG:
-                    log.debug("Completed pending writes to database have finished")
+                log.debug("Completed pending writes to database have finished")
 
     def append_task(self, ctx: commands.Context, event: str, task: Tuple, _id: int = None) -> None:
         """Add a task to the cache to be run later"""
         lock_id = _id or ctx.message.id
-        if lock_id not in self._tasks:
-            self._tasks[lock_id] = {"update": [], "insert": [], "global": []}
-        self._tasks[lock_id][event].append(task)
+        bucket = self._tasks.setdefault(lock_id, _PendingTasks())
+        bucket.for_event(event).append(task)
+        payload = task[1]
+        self._pending_rows += len(payload) if isinstance(payload, list) else 1
+        if self._pending_rows >= _WRITER_FLUSH_ROWS:
+            self._flush_event.set()
 
     async def fetch_spotify_query(
         self,
@@ -195,10 +322,11 @@ class AudioAPIInterface:
         )
         total_tracks = len(tracks)
         database_entries = []
+        track_infos = []
         track_count = 0
-        time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
-        youtube_cache = CacheLevel.set_youtube().is_subset(current_cache_level)
-        async for track in AsyncIter(tracks):
+        time_now = int(time.time())
+        spotify_cache = _SPOTIFY_CACHE.is_subset(current_cache_level)
+        async for track in AsyncIter(tracks, steps=50):
             if isinstance(track, str):
                 break
             elif isinstance(track, dict) and track.get("error", {}).get("message") == "invalid id":
@@ -213,44 +341,65 @@ class AudioAPIInterface:
                 _type,
             ) = await self.spotify_api.get_spotify_track_info(track, ctx)
 
-            database_entries.append(
-                {
-                    "id": _id,
-                    "type": _type,
-                    "uri": uri,
-                    "track_name": track_name,
-                    "artist_name": artist_name,
-                    "song_url": song_url,
-                    "track_info": track_info,
-                    "last_updated": time_now,
-                    "last_fetched": time_now,
-                }
-            )
-            if skip_youtube is False:
-                val = None
-                if youtube_cache:
-                    try:
-                        (val, last_update) = await self.local_cache_api.youtube.fetch_one(
-                            {"track": track_info}
-                        )
-                    except Exception as exc:
-                        debug_exc_log(log, exc, f"Failed to fetch {track_info} from YouTube table")
+            if spotify_cache:
+                database_entries.append(
+                    (
+                        _id,
+                        _type,
+                        uri,
+                        track_name,
+                        artist_name,
+                        song_url,
+                        track_info,
+                        time_now,
+                        time_now,
+                    )
+                )
+            track_infos.append(track_info)
+        if skip_youtube is False:
+            youtube_cache = _YOUTUBE_CACHE.is_subset(current_cache_level)
+            cached_urls: MutableMapping[str, str] = {}
+            if youtube_cache:
+                try:
+                    cached_urls = await self.local_cache_api.youtube.fetch_many(track_infos)
+                except Exception as exc:
+                    debug_exc_log(log, exc, "Failed batch fetch from YouTube table")
+                for cached_info, cached_url in cached_urls.items():
+                    self._lru_cache_put("youtube", cached_info, cached_url)
+            semaphore = asyncio.Semaphore(_YOUTUBE_LOOKUP_CONCURRENCY)
+            last_notify = 0.0
 
-                if val is None:
-                    val = await self.fetch_youtube_query(
-                        ctx, track_info, current_cache_level=current_cache_level
+            async def _resolve_one(track_info: str) -> Optional[str]:
+                nonlocal track_count, last_notify
+                async with semaphore:
+                    val = None
+                    if youtube_cache:
+                        val = cached_urls.get(track_info) or self._lru_cache_get(
+                            "youtube", track_info
+                        )
+                    if val is None:
+                        val = await self.fetch_youtube_query(
+                            ctx, track_info, current_cache_level=current_cache_level
+                        )
+                    if youtube_cache and val:
+                        task = ("update", ("youtube", {"track": track_info}))
+                        self.append_task(ctx, *task)
+                track_count += 1
+                now = time.monotonic()
+                if notifier is not None and (
+                    (now - last_notify) > _NOTIFIER_UPDATE_INTERVAL or track_count == total_tracks
+                ):
+                    last_notify = now
+                    await notifier.notify_user(
+                        current=track_count, total=total_tracks, key="youtube"
                     )
-                if youtube_cache and val:
-                    task = ("update", ("youtube", {"track": track_info}))
-                    self.append_task(ctx, *task)
-                if val:
-                    youtube_urls.append(val)
-            else:
-                youtube_urls.append(track_info)
-            track_count += 1
-            if notifier is not None and ((track_count % 2 == 0) or (track_count == total_tracks)):
-                await notifier.notify_user(current=track_count, total=total_tracks, key="youtube")
-        if CacheLevel.set_spotify().is_subset(current_cache_level):
+                return val
+
+            vals = await asyncio.gather(*[_resolve_one(t) for t in track_infos])
+            youtube_urls.extend(val for val in vals if val)
+        else:
+            youtube_urls.extend(track_infos)
+        if spotify_cache and database_entries:
             task = ("insert", ("spotify", database_entries))
             self.append_task(ctx, *task)
         return youtube_urls
@@ -259,68 +408,83 @@ class AudioAPIInterface:
         self,
         query_type: str,
         uri: str,
-        recursive: Union[str, bool] = False,
         params: MutableMapping = None,
         notifier: Optional[Notifier] = None,
         ctx: Context = None,
     ) -> Union[List[MutableMapping], List[str]]:
-        """Gets track info from spotify API"""
-
-        if recursive is False:
-            (call, params) = self.spotify_api.spotify_format_call(query_type, uri)
-            results = await self.spotify_api.make_get_call(call, params)
-        else:
-            if isinstance(recursive, str):
-                results = await self.spotify_api.make_get_call(recursive, params)
-            else:
-                results = {}
+        """Gets track info from spotify API, sharing identical in-flight calls"""
+        key = ("spotify", query_type, uri)
+        inflight = self._inflight_queries.get(key)
+        if inflight is not None:
+            return await inflight
+        fut: asyncio.Future = asyncio.get_event_loop().create_future()
+        self._inflight_queries[key] = fut
         try:
-            if results["error"]["status"] == 401 and not recursive:
-                raise SpotifyFetchError(
-                    _(
-                        "The Spotify API key or client secret has not been set properly. "
-                        "\nUse `{prefix}audioset spotifyapi` for instructions."
-                    )
-                )
-            elif recursive:
-                return {"next": None}
-        except KeyError:
-            pass
-        if recursive:
+            results = await self._fetch_from_spotify_api(
+                query_type, uri, params=params, notifier=notifier, ctx=ctx
+            )
+        except Exception as exc:
+            if not fut.done():
+                fut.set_exception(exc)
+                fut.exception()  # prevent an unretrieved exception warning if nobody waits
+            raise
+        else:
+            if not fut.done():
+                fut.set_result(results)
             return results
-        tracks = []
+        finally:
+            self._inflight_queries.pop(key, None)
+
+    async def _fetch_from_spotify_api(
+        self,
+        query_type: str,
+        uri: str,
+        params: MutableMapping = None,
+        notifier: Optional[Notifier] = None,
+        ctx: Context = None,
+    ) -> Union[List[MutableMapping], List[str]]:
+        """Gets track info from spotify API, walking pagination iteratively"""
+
+        (call, params) = self.spotify_api.spotify_format_call(query_type, uri)
+        tracks: List = []
         track_count = 0
-        total_tracks = results.get("tracks", results).get("total", 1)
-        while True:
+        total_tracks = 1
+        first_page = True
+        while call is not None:
+            results = await self.spotify_api.make_get_call(call, params)
+            try:
+                if results["error"]["status"] == 401:
+                    if not first_page:
+                        break
+                    raise SpotifyFetchError(
+                        _(
+                            "The Spotify API key or client secret has not been set properly. "
+                            "\nUse `{prefix}audioset spotifyapi` for instructions."
+                        )
+                    )
+            except KeyError:
+                pass
+            container = results.get("tracks", results)
+            if first_page:
+                total_tracks = container.get("total", 1)
+                first_page = False
+            items = container.get("items") or []
             new_tracks: List = []
             if query_type == "track":
                 new_tracks = results
                 tracks.append(new_tracks)
             elif query_type == "album":
-                tracks_raw = results.get("tracks", results).get("items", [])
-                if tracks_raw:
-                    new_tracks = tracks_raw
-                    tracks.extend(new_tracks)
-            else:
-                tracks_raw = results.get("tracks", results).get("items", [])
-                if tracks_raw:
-                    new_tracks = [k["track"] for k in tracks_raw if k.get("track")]
+                if items:
+                    new_tracks = items
                     tracks.extend(new_tracks)
+            elif items:
+                new_tracks = [k["track"] for k in items if k.get("track")]
+                tracks.extend(new_tracks)
             track_count += len(new_tracks)
             if notifier:
                 await notifier.notify_user(current=track_count, total=total_tracks, key="spotify")
-            try:
-                if results.get("next") is not None:
-                    results = await self.fetch_from_spotify_api(
-                        query_type, uri, results["next"], params, notifier=notifier
-                    )
-                    continue
-                else:
-                    break
-            except KeyError:
-                raise SpotifyFetchError(
-                    _("This doesn't seem to be a valid Spotify playlist/album URL or code.")
-                )
+            call = results.get("next")
+            params = {}
         return tracks
 
     async def spotify_query(
@@ -350,18 +514,22 @@ class AudioAPIInterface:
         List[str]
             List of Youtube URLs.
         """
-        current_cache_level = CacheLevel(await self.config.cache_level())
-        cache_enabled = CacheLevel.set_spotify().is_subset(current_cache_level)
+        current_cache_level = await self._get_ctx_cache_level(ctx)
+        cache_enabled = _SPOTIFY_CACHE.is_subset(current_cache_level)
         if query_type == "track" and cache_enabled:
-            try:
-                (val, last_update) = await self.local_cache_api.spotify.fetch_one(
-                    {"uri": f"spotify:track:{uri}"}
-                )
-            except Exception as exc:
-                debug_exc_log(
-                    log, exc, f"Failed to fetch 'spotify:track:{uri}' from Spotify table"
-                )
-                val = None
+            val = self._lru_cache_get("spotify", f"spotify:track:{uri}")
+            if val is None:
+                try:
+                    (val, last_update) = await self.local_cache_api.spotify.fetch_one(
+                        {"uri": f"spotify:track:{uri}"}
+                    )
+                except Exception as exc:
+                    debug_exc_log(
+                        log, exc, f"Failed to fetch 'spotify:track:{uri}' from Spotify table"
+                    )
+                    val = None
+                if val:
+                    self._lru_cache_put("spotify", f"spotify:track:{uri}", val)
         else:
             val = None
         youtube_urls = []
@@ -425,7 +593,7 @@ class AudioAPIInterface:
         track_list: List = []
         has_not_allowed = False
         try:
-            current_cache_level = CacheLevel(await self.config.cache_level())
+            current_cache_level = await self._get_ctx_cache_level(ctx)
             guild_data = await self.config.guild(ctx.guild).all()
             enqueued_tracks = 0
             consecutive_fails = 0
@@ -446,11 +614,13 @@ class AudioAPIInterface:
 
                 return track_list
             database_entries = []
-            time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+            time_now = int(time.time())
 
-            youtube_cache = CacheLevel.set_youtube().is_subset(current_cache_level)
-            spotify_cache = CacheLevel.set_spotify().is_subset(current_cache_level)
-            async for track_count, track in AsyncIter(tracks_from_spotify).enumerate(start=1):
+            youtube_cache = _YOUTUBE_CACHE.is_subset(current_cache_level)
+            spotify_cache = _SPOTIFY_CACHE.is_subset(current_cache_level)
+            local_path = self.cog.local_folder_current_path
+            track_infos = []
+            async for track in AsyncIter(tracks_from_spotify, steps=50):
                 (
                     song_url,
                     track_info,
@@ -462,28 +632,34 @@ class AudioAPIInterface:
                 ) = await self.spotify_api.get_spotify_track_info(track, ctx)
 
                 database_entries.append(
-                    {
-                        "id": _id,
-                        "type": _type,
-                        "uri": uri,
-                        "track_name": track_name,
-                        "artist_name": artist_name,
-                        "song_url": song_url,
-                        "track_info": track_info,
-                        "last_updated": time_now,
-                        "last_fetched": time_now,
-                    }
+                    (
+                        _id,
+                        _type,
+                        uri,
+                        track_name,
+                        artist_name,
+                        song_url,
+                        track_info,
+                        time_now,
+                        time_now,
+                    )
                 )
+                track_infos.append(track_info)
+            cached_urls: MutableMapping[str, str] = {}
+            if youtube_cache:
+                try:
+                    cached_urls = await self.local_cache_api.youtube.fetch_many(track_infos)
+                except Exception as exc:
+                    debug_exc_log(log, exc, "Failed batch fetch from YouTube table")
+                for cached_info, cached_url in cached_urls.items():
+                    self._lru_cache_put("youtube", cached_info, cached_url)
+            last_notify = 0.0
+            track_infos_iter = AsyncIter(track_infos, steps=50).enumerate(start=1)
+            async for track_count, track_info in track_infos_iter:
                 val = None
                 llresponse = None
                 if youtube_cache:
-                    try:
-                        (val, last_updated) = await self.local_cache_api.youtube.fetch_one(
-                            {"track": track_info}
-                        )
-                    except Exception as exc:
-                        debug_exc_log(log, exc, f"Failed to fetch {track_info} from YouTube table")
-
+                    val = cached_urls.get(track_info) or self._lru_cache_get("youtube", track_info)
                 if val is None:
                     val = await self.fetch_youtube_query(
                         ctx, track_info, current_cache_level=current_cache_level
@@ -495,12 +671,10 @@ class AudioAPIInterface:
                 if llresponse is not None:
                     track_object = llresponse.tracks
                 elif val:
+                    track_query = Query.process_input(val, local_path)
                     try:
                         (result, called_api) = await self.fetch_track(
-                            ctx,
-                            player,
-                            Query.process_input(val, self.cog.local_folder_current_path),
-                            forced=forced,
+                            ctx, player, track_query, forced=forced,
                         )
                     except (RuntimeError, aiohttp.ServerDisconnectedError):
                         lock(ctx, False)
@@ -523,7 +697,11 @@ class AudioAPIInterface:
                     track_object = result.tracks
                 else:
                     track_object = []
-                if (track_count % 2 == 0) or (track_count == total_tracks):
+                now = time.monotonic()
+                if (now - last_notify) > _NOTIFIER_UPDATE_INTERVAL or (
+                    track_count == total_tracks
+                ):
+                    last_notify = now
                     key = "lavalink"
                     seconds = "???"
                     second_key = None
@@ -549,12 +727,13 @@ class AudioAPIInterface:
                     continue
                 consecutive_fails = 0
                 single_track = track_object[0]
+                single_track_query = Query.process_input(single_track, local_path)
                 if not await self.cog.is_query_allowed(
                     self.config,
                     ctx.guild,
                     (
                         f"{single_track.title} {single_track.author} {single_track.uri} "
-                        f"{Query.process_input(single_track, self.cog.local_folder_current_path)}"
+                        f"{single_track_query}"
                     ),
                 ):
                     has_not_allowed = True
@@ -643,24 +822,35 @@ class AudioAPIInterface:
         """
         Call the Youtube API and returns the youtube URL that the query matched
         """
-        track_url = await self.youtube_api.get_call(track_info)
-        if CacheLevel.set_youtube().is_subset(current_cache_level) and track_url:
-            time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
-            task = (
-                "insert",
-                (
-                    "youtube",
-                    [
+        key = ("youtube", track_info)
+        inflight = self._inflight_queries.get(key)
+        if inflight is not None:
+            return await inflight
+        fut: asyncio.Future = asyncio.get_event_loop().create_future()
+        self._inflight_queries[key] = fut
+        track_url = None
+        try:
+            track_url = await self.youtube_api.get_call(track_info)
+            if _YOUTUBE_CACHE.is_subset(current_cache_level) and track_url:
+                self._lru_cache_put("youtube", track_info, track_url)
+                time_now = int(time.time())
+                task = (
+                    "insert",
+                    (
+                        "youtube",
                         {
                             "track_info": track_info,
                             "track_url": track_url,
                             "last_updated": time_now,
                             "last_fetched": time_now,
-                        }
-                    ],
-                ),
-            )
-            self.append_task(ctx, *task)
+                        },
+                    ),
+                )
+                self.append_task(ctx, *task)
+        finally:
+            if not fut.done():
+                fut.set_result(track_url)
+            self._inflight_queries.pop(key, None)
         return track_url
 
     async def fetch_from_youtube_api(
@@ -669,14 +859,18 @@ class AudioAPIInterface:
         """
         Gets an YouTube URL from for the query
         """
-        current_cache_level = CacheLevel(await self.config.cache_level())
-        cache_enabled = CacheLevel.set_youtube().is_subset(current_cache_level)
+        current_cache_level = await self._get_ctx_cache_level(ctx)
+        cache_enabled = _YOUTUBE_CACHE.is_subset(current_cache_level)
         val = None
         if cache_enabled:
+            val = self._lru_cache_get("youtube", track_info)
+        if val is None and cache_enabled:
             try:
                 (val, update) = await self.local_cache_api.youtube.fetch_one({"track": track_info})
             except Exception as exc:
                 debug_exc_log(log, exc, f"Failed to fetch {track_info} from YouTube table")
+            if val:
+                self._lru_cache_put("youtube", track_info, val)
         if val is None:
             youtube_url = await self.fetch_youtube_query(
                 ctx, track_info, current_cache_level=current_cache_level
@@ -720,8 +914,8 @@ class AudioAPIInterface:
         Tuple[lavalink.LoadResult, bool]
             Tuple with the Load result and whether or not the API was called.
         """
-        current_cache_level = CacheLevel(await self.config.cache_level())
-        cache_enabled = CacheLevel.set_lavalink().is_subset(current_cache_level)
+        current_cache_level = await self._get_ctx_cache_level(ctx)
+        cache_enabled = _LAVALINK_CACHE.is_subset(current_cache_level)
         val = None
         query = Query.process_input(query, self.cog.local_folder_current_path)
         query_string = str(query)
@@ -768,17 +962,37 @@ class AudioAPIInterface:
                 # If cached value has an invalid entry make a new call so that it gets updated
                 results, called_api = await self.fetch_track(ctx, player, query, forced=True)
         else:
+            called_api = True
+            query_key = ("lavalink", query_string)
+            inflight = self._inflight_queries.get(query_key)
+            if inflight is not None:
+                # An identical query is already on its way to the node; share
+                # its result instead of issuing a duplicate call and write.
+                results = await inflight
+                if results is None:
+                    results = _FAILED_LOAD_RESULT
+                return results, called_api
             if IS_DEBUG:
                 log.debug(f"Querying Lavalink api for {query_string}")
-            called_api = True
+            fut: asyncio.Future = asyncio.get_event_loop().create_future()
+            self._inflight_queries[query_key] = fut
             try:
-                results = await player.load_tracks(query_string)
-            except KeyError:
-                results = None
-            except RuntimeError:
-                raise TrackEnqueueError
+                try:
+                    results = await player.load_tracks(query_string)
+                except KeyError:
+                    results = None
+                except RuntimeError:
+                    exc = TrackEnqueueError()
+                    fut.set_exception(exc)
+                    fut.exception()
+                    raise exc
+                fut.set_result(results)
+            finally:
+                if not fut.done():
+                    fut.set_result(None)
+                self._inflight_queries.pop(query_key, None)
         if results is None:
-            results = LoadResult({"loadType": "LOAD_FAILED", "playlistInfo": {}, "tracks": []})
+            results = _FAILED_LOAD_RESULT
 
         if (
             cache_enabled
@@ -788,21 +1002,24 @@ class AudioAPIInterface:
             and results.tracks
         ):
             try:
-                time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
-                data = json.dumps(results._raw)
-                if all(k in data for k in ["loadType", "playlistInfo", "isSeekable", "isStream"]):
+                raw = results._raw
+                first_track_info = (raw.get("tracks") or [{}])[0].get("info", {})
+                if (
+                    _REQUIRED_RESULT_KEYS <= raw.keys()
+                    and _REQUIRED_TRACK_KEYS <= first_track_info.keys()
+                ):
+                    time_now = int(time.time())
+                    data = json.dumps(raw, separators=(",", ":"))
                     task = (
                         "insert",
                         (
                             "lavalink",
-                            [
-                                {
-                                    "query": query_string,
-                                    "data": data,
-                                    "last_updated": time_now,
-                                    "last_fetched": time_now,
-                                }
-                            ],
+                            {
+                                "query": query_string,
+                                "data": data,
+                                "last_updated": time_now,
+                                "last_fetched": time_now,
+                            },
                         ),
                     )
                     self.append_task(ctx, *task)
@@ -814,81 +1031,100 @@ class AudioAPIInterface:
                 )
         return results, called_api
 
+    @staticmethod
+    def _autoplay_prefetch_done(task: asyncio.Task) -> None:
+        """Consume prefetch outcomes so failures don't log as never-retrieved"""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            debug_exc_log(log, exc, "Autoplay prefetch failed")
+
+    async def _fetch_autoplay_fallback(self, player: lavalink.Player) -> List:
+        """Resolve the fallback playlist used when autoplay has no local candidates"""
+        guild = player.channel.guild
+        results, _called_api = await self.fetch_track(
+            cast(commands.Context, _AutoplayContext(guild, guild, self.cog)),
+            player,
+            Query.process_input(_TOP_100_US, self.cog.local_folder_current_path),
+        )
+        return list(results.tracks)
+
     async def autoplay(self, player: lavalink.Player, playlist_api: PlaylistWrapper):
         """
         Enqueue a random track
         """
-        autoplaylist = await self.config.guild(player.channel.guild).autoplaylist()
-        current_cache_level = CacheLevel(await self.config.cache_level())
-        cache_enabled = CacheLevel.set_lavalink().is_subset(current_cache_level)
+        guild = player.channel.guild
+        me = guild.me
+        autoplaylist = await self.config.guild(guild).autoplaylist()
+        local_path = self.cog.local_folder_current_path
+        current_cache_level = await self._get_ctx_cache_level(None)
+        cache_enabled = _LAVALINK_CACHE.is_subset(current_cache_level)
         playlist = None
         tracks = None
         if autoplaylist["enabled"]:
             try:
                 playlist = await get_playlist(
-                    autoplaylist["id"],
-                    autoplaylist["scope"],
-                    self.bot,
-                    playlist_api,
-                    player.channel.guild,
-                    player.channel.guild.me,
+                    autoplaylist["id"], autoplaylist["scope"], self.bot, playlist_api, guild, me,
                 )
                 tracks = playlist.tracks_obj
             except Exception as exc:
                 debug_exc_log(log, exc, "Failed to fetch playlist for autoplay")
 
-        if not tracks or not getattr(playlist, "tracks", None):
+        if not tracks or playlist is None or not playlist.tracks:
             if cache_enabled:
                 track = await self.get_random_track_from_db()
                 tracks = [] if not track else [track]
             if not tracks:
-                ctx = namedtuple("Context", "message guild cog")
-                (results, called_api) = await self.fetch_track(
-                    cast(
-                        commands.Context, ctx(player.channel.guild, player.channel.guild, self.cog)
-                    ),
-                    player,
-                    Query.process_input(_TOP_100_US, self.cog.local_folder_current_path),
-                )
-                tracks = list(results.tracks)
+                prefetched = self._autoplay_prefetch.pop(guild.id, None)
+                if prefetched is not None:
+                    try:
+                        tracks = await prefetched
+                    except Exception as exc:
+                        debug_exc_log(log, exc, "Autoplay prefetch failed")
+                        tracks = []
+                if not tracks:
+                    tracks = await self._fetch_autoplay_fallback(player)
+                if guild.id not in self._autoplay_prefetch:
+                    prefetch = asyncio.create_task(self._fetch_autoplay_fallback(player))
+                    prefetch.add_done_callback(self._autoplay_prefetch_done)
+                    self._autoplay_prefetch[guild.id] = prefetch
         if tracks:
-            multiple = len(tracks) > 1
-            valid = not multiple
-            tries = len(tracks)
             track = tracks[0]
-            while valid is False and multiple:
-                tries -= 1
-                if tries <= 0:
+            if len(tracks) > 1:
+                candidates = []
+                for candidate in tracks:
+                    query = Query.process_input(candidate, local_path)
+                    if not query.valid or (
+                        query.is_local
+                        and query.local_track_path is not None
+                        and not query.local_track_path.exists()
+                    ):
+                        continue
+                    candidates.append((candidate, query))
+                if not candidates:
                     raise DatabaseError("No valid entry found")
-                track = random.choice(tracks)
-                query = Query.process_input(track, self.cog.local_folder_current_path)
-                await asyncio.sleep(0.001)
-                if not query.valid or (
-                    query.is_local
-                    and query.local_track_path is not None
-                    and not query.local_track_path.exists()
-                ):
-                    continue
-                if not await self.cog.is_query_allowed(
-                    self.config,
-                    player.channel.guild,
-                    (
-                        f"{track.title} {track.author} {track.uri} "
-                        f"{str(Query.process_input(track, self.cog.local_folder_current_path))}"
-                    ),
-                ):
-                    if IS_DEBUG:
-                        log.debug(
-                            "Query is not allowed in "
-                            f"{player.channel.guild} ({player.channel.guild.id})"
+                random.shuffle(candidates)
+                checked: MutableMapping[str, bool] = {}
+                for track, query in candidates:
+                    allowed = checked.get(track.uri)
+                    if allowed is None:
+                        allowed = await self.cog.is_query_allowed(
+                            self.config,
+                            guild,
+                            " ".join((track.title, track.author, track.uri, str(query))),
                         )
-                    continue
-                valid = True
+                        checked[track.uri] = allowed
+                    if not allowed:
+                        if IS_DEBUG:
+                            log.debug(f"Query is not allowed in {guild} ({guild.id})")
+                        continue
+                    break
+                else:
+                    raise DatabaseError("No valid entry found")
 
             track.extras["autoplay"] = True
-            player.add(player.channel.guild.me, track)
-            self.bot.dispatch(
-                "red_audio_track_auto_play", player.channel.guild, track, player.channel.guild.me
-            )
+            player.add(me, track)
+            self.bot.dispatch("red_audio_track_auto_play", guild, track, me)
             if not player.current:
                 await player.play()
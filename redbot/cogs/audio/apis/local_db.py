@@ -38,12 +38,17 @@ from ..sql_statements import (
     YOUTUBE_DELETE_OLD_ENTRIES,
     YOUTUBE_QUERY,
     YOUTUBE_QUERY_ALL,
+    YOUTUBE_QUERY_MANY,
     YOUTUBE_QUERY_LAST_FETCHED_RANDOM,
     YOUTUBE_UPDATE,
     YOUTUBE_UPSERT,
     PRAGMA_FETCH_user_version,
+    PRAGMA_SET_busy_timeout,
+    PRAGMA_SET_cache_size,
     PRAGMA_SET_journal_mode,
+    PRAGMA_SET_mmap_size,
     PRAGMA_SET_read_uncommitted,
+    PRAGMA_SET_synchronous,
     PRAGMA_SET_temp_store,
     PRAGMA_SET_user_version,
 )
@@ -70,10 +75,18 @@ class BaseWrapper:
         self.bot = bot
         self.config = config
         self.database = conn
+        # SELECT statements go through this connection; it is swapped for a
+        # dedicated read-only connection once the schema exists so reads do
+        # not queue behind the writer.
+        self.database_read = conn
         self.statement = SimpleNamespace()
         self.statement.pragma_temp_store = PRAGMA_SET_temp_store
         self.statement.pragma_journal_mode = PRAGMA_SET_journal_mode
         self.statement.pragma_read_uncommitted = PRAGMA_SET_read_uncommitted
+        self.statement.pragma_synchronous = PRAGMA_SET_synchronous
+        self.statement.pragma_cache_size = PRAGMA_SET_cache_size
+        self.statement.pragma_busy_timeout = PRAGMA_SET_busy_timeout
+        self.statement.pragma_mmap_size = PRAGMA_SET_mmap_size
         self.statement.set_user_version = PRAGMA_SET_user_version
         self.statement.get_user_version = PRAGMA_FETCH_user_version
         self.fetch_result: Optional[Callable] = None
@@ -85,6 +98,10 @@ class BaseWrapper:
             executor.submit(self.database.cursor().execute, self.statement.pragma_temp_store)
             executor.submit(self.database.cursor().execute, self.statement.pragma_journal_mode)
             executor.submit(self.database.cursor().execute, self.statement.pragma_read_uncommitted)
+            executor.submit(self.database.cursor().execute, self.statement.pragma_synchronous)
+            executor.submit(self.database.cursor().execute, self.statement.pragma_cache_size)
+            executor.submit(self.database.cursor().execute, self.statement.pragma_busy_timeout)
+            executor.submit(self.database.cursor().execute, self.statement.pragma_mmap_size)
             executor.submit(self.maybe_migrate)
             executor.submit(self.database.cursor().execute, LAVALINK_CREATE_TABLE)
             executor.submit(self.database.cursor().execute, LAVALINK_CREATE_INDEX)
@@ -94,6 +111,10 @@ class BaseWrapper:
             executor.submit(self.database.cursor().execute, SPOTIFY_CREATE_INDEX)
             await self.clean_up_old_entries()
 
+    def attach_read_connection(self, conn: APSWConnectionWrapper) -> None:
+        """Route SELECT statements through a separate (read-only) connection"""
+        self.database_read = conn
+
     def close(self) -> None:
         """Close the connection with the local cache"""
         with contextlib.suppress(Exception):
@@ -102,8 +123,7 @@ class BaseWrapper:
     async def clean_up_old_entries(self) -> None:
         """Delete entries older than x in the local cache tables"""
         max_age = await self.config.cache_age()
-        maxage = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=max_age)
-        maxage_int = int(time.mktime(maxage.timetuple()))
+        maxage_int = int(time.time()) - max_age * 86400
         values = {"maxage": maxage_int}
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
             executor.submit(self.database.cursor().execute, LAVALINK_DELETE_OLD_ENTRIES, values)
@@ -136,7 +156,7 @@ class BaseWrapper:
     async def insert(self, values: List[MutableMapping]) -> None:
         """Insert an entry into the local cache"""
         try:
-            with self.database.transaction() as transaction:
+            with self.database.transaction_immediate() as transaction:
                 transaction.executemany(self.statement.upsert, values)
         except Exception as exc:
             debug_exc_log(log, exc, "Error during table insert")
@@ -145,7 +165,7 @@ class BaseWrapper:
         """Update an entry of the local cache"""
 
         try:
-            time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+            time_now = int(time.time())
             values["last_fetched"] = time_now
             with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
                 executor.submit(self.database.cursor().execute, self.statement.update, values)
@@ -159,13 +179,16 @@ class BaseWrapper:
     ]:
         """Get an entry from the local cache"""
         max_age = await self.config.cache_age()
-        maxage = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=max_age)
-        maxage_int = int(time.mktime(maxage.timetuple()))
+        maxage_int = int(time.time()) - max_age * 86400
         values.update({"maxage": maxage_int})
         row = None
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
             for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_one, values)]
+                [
+                    executor.submit(
+                        self.database_read.cursor().execute, self.statement.get_one, values
+                    )
+                ]
             ):
                 try:
                     row_result = future.result()
@@ -188,7 +211,11 @@ class BaseWrapper:
             return []
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
             for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_all, values)]
+                [
+                    executor.submit(
+                        self.database_read.cursor().execute, self.statement.get_all, values
+                    )
+                ]
             ):
                 try:
                     row_result = future.result()
@@ -209,7 +236,7 @@ class BaseWrapper:
             for future in concurrent.futures.as_completed(
                 [
                     executor.submit(
-                        self.database.cursor().execute, self.statement.get_random, values
+                        self.database_read.cursor().execute, self.statement.get_random, values
                     )
                 ]
             ):
@@ -250,6 +277,31 @@ class YouTubeTableWrapper(BaseWrapper):
             return None, None
         return result.query, result.updated_on
 
+    async def fetch_many(self, track_infos: List[str]) -> MutableMapping[str, str]:
+        """Get entries from the Youtube table for multiple tracks in one query"""
+        output: MutableMapping[str, str] = {}
+        if not track_infos:
+            return output
+        max_age = await self.config.cache_age()
+        maxage_int = int(time.time()) - max_age * 86400
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            for i in range(0, len(track_infos), 500):
+                chunk = track_infos[i : i + 500]
+                statement = YOUTUBE_QUERY_MANY.format(placeholders=", ".join("?" * len(chunk)))
+                for future in concurrent.futures.as_completed(
+                    [
+                        executor.submit(
+                            self.database_read.cursor().execute, statement, (*chunk, maxage_int)
+                        )
+                    ]
+                ):
+                    try:
+                        for track_info, youtube_url in future.result().fetchall():
+                            output[track_info] = youtube_url
+                    except Exception as exc:
+                        debug_exc_log(log, exc, "Failed to complete batch fetch from database")
+        return output
+
     async def fetch_all(self, values: MutableMapping) -> List[YouTubeCacheFetchResult]:
         """Get all entries from the Youtube table"""
         result = await self._fetch_all(values)
@@ -346,7 +398,11 @@ class LavalinkTableWrapper(BaseWrapper):
             return []
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
             for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_all_global)]
+                [
+                    executor.submit(
+                        self.database_read.cursor().execute, self.statement.get_all_global
+                    )
+                ]
             ):
                 try:
                     row_result = future.result()
@@ -370,3 +426,9 @@ class LocalCacheWrapper:
         self.lavalink: LavalinkTableWrapper = LavalinkTableWrapper(bot, config, conn, self.cog)
         self.spotify: SpotifyTableWrapper = SpotifyTableWrapper(bot, config, conn, self.cog)
         self.youtube: YouTubeTableWrapper = YouTubeTableWrapper(bot, config, conn, self.cog)
+
+    def attach_read_connection(self, conn: APSWConnectionWrapper) -> None:
+        """Route all table SELECT statements through a read-only connection"""
+        self.lavalink.attach_read_connection(conn)
+        self.spotify.attach_read_connection(conn)
+        self.youtube.attach_read_connection(conn)
@@ -8,6 +8,10 @@ __all__ = [
     "PRAGMA_SET_temp_store",
     "PRAGMA_SET_journal_mode",
     "PRAGMA_SET_read_uncommitted",
+    "PRAGMA_SET_synchronous",
+    "PRAGMA_SET_cache_size",
+    "PRAGMA_SET_busy_timeout",
+    "PRAGMA_SET_mmap_size",
     "PRAGMA_FETCH_user_version",
     "PRAGMA_SET_user_version",
     # Playlist table statements
@@ -28,6 +32,7 @@ __all__ = [
     "YOUTUBE_UPSERT",
     "YOUTUBE_UPDATE",
     "YOUTUBE_QUERY",
+    "YOUTUBE_QUERY_MANY",
     "YOUTUBE_QUERY_ALL",
     "YOUTUBE_DELETE_OLD_ENTRIES",
     "YOUTUBE_QUERY_LAST_FETCHED_RANDOM",
@@ -71,6 +76,26 @@ PRAGMA_SET_read_uncommitted: Final[
 ] = """
 PRAGMA read_uncommitted = 1;
 """
+PRAGMA_SET_synchronous: Final[
+    str
+] = """
+PRAGMA synchronous = NORMAL;
+"""
+PRAGMA_SET_cache_size: Final[
+    str
+] = """
+PRAGMA cache_size = -20000;
+"""
+PRAGMA_SET_busy_timeout: Final[
+    str
+] = """
+PRAGMA busy_timeout = 5000;
+"""
+PRAGMA_SET_mmap_size: Final[
+    str
+] = """
+PRAGMA mmap_size = 268435456;
+"""
 PRAGMA_FETCH_user_version: Final[
     str
 ] = """
@@ -306,6 +331,17 @@ WHERE
     AND last_updated > :maxage
 LIMIT 1;
 """
+# Template: the placeholder list is expanded to one "?" per queried track
+YOUTUBE_QUERY_MANY: Final[
+    str
+] = """
+SELECT track_info, youtube_url
+FROM youtube
+WHERE
+    track_info IN ({placeholders})
+    AND last_updated > ?
+;
+"""
 YOUTUBE_QUERY_ALL: Final[
     str
 ] = """
@@ -359,6 +395,8 @@ SPOTIFY_CREATE_INDEX: Final[
 CREATE UNIQUE INDEX IF NOT EXISTS idx_spotify_uri
 ON spotify (id, type, uri);
 """
+# Rows are bound positionally as
+# (id, type, uri, track_name, artist_name, song_url, track_info, last_updated, last_fetched)
 SPOTIFY_UPSERT: Final[
     str
 ] = """INSERT INTO
@@ -369,8 +407,8 @@ spotify
   )
 VALUES
   (
-    :id, :type, :uri, :track_name, :artist_name,
-    :song_url, :track_info, :last_updated, :last_fetched
+    ?, ?, ?, ?, ?,
+    ?, ?, ?, ?
   )
 ON CONFLICT
   (
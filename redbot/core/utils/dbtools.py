@@ -48,6 +48,24 @@ class ContextManagerMixin(ProvidesCursor):
         finally:
             c.close()
 
+    @contextmanager
+    def transaction_immediate(self) -> Generator[apsw.Cursor, None, None]:
+        """
+        Same as ``transaction`` but takes the write lock up front,
+        avoiding a lock upgrade mid-transaction on write-heavy paths
+        """
+        c = self.cursor()  # pylint: disable=assignment-from-no-return
+        try:
+            c.execute("BEGIN IMMEDIATE TRANSACTION")
+            yield c
+        except Exception:
+            c.execute("ROLLBACK TRANSACTION")
+            raise
+        else:
+            c.execute("COMMIT TRANSACTION")
+        finally:
+            c.close()
+
 
 class APSWConnectionWrapper(apsw.Connection, ContextManagerMixin):
     """